@@ -1,12 +1,29 @@
 """Shared data structures for link monitoring and analysis."""
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+_last_isoformat: tuple[int, str] = (-1, "")
 
-@dataclass(slots=True)
+
+def isoformat_seconds(timestamp_ns: int) -> str:
+    """Formats a ``time.time_ns()`` value as a UTC ISO-8601 string with second precision.
+
+    The most recent result is reused, so bursts within the same second format once.
+    """
+    global _last_isoformat
+    seconds = timestamp_ns // 1_000_000_000
+    cached_seconds, text = _last_isoformat
+    if cached_seconds != seconds:
+        text = datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()
+        _last_isoformat = (seconds, text)
+    return text
+
+
+@dataclass(slots=True, frozen=True)
 class LinkAnalysisResult:
     """Represents the outcome of link inspection."""
 
@@ -22,12 +39,17 @@ class LinkClickEvent:
 
     url: str
     source: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
     metadata: Dict[str, Any] = field(default_factory=dict)
     blocked: bool = False
     blocked_by: Optional[str] = None
     block_reason: Optional[str] = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """UTC time at which the event was created."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
     def block(self, *, reason: str, blocked_by: str) -> None:
         """Marks the event as blocked and annotates the metadata."""
         if self.blocked:
@@ -35,7 +57,8 @@ class LinkClickEvent:
         self.blocked = True
         self.block_reason = reason
         self.blocked_by = blocked_by
-        self.metadata.setdefault("blocked_at", datetime.utcnow().isoformat(timespec="seconds"))
+        if "blocked_at" not in self.metadata:
+            self.metadata["blocked_at"] = isoformat_seconds(time.time_ns())
 
 
-__all__ = ["LinkAnalysisResult", "LinkClickEvent"]
+__all__ = ["LinkAnalysisResult", "LinkClickEvent", "isoformat_seconds"]
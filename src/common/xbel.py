@@ -0,0 +1,58 @@
+"""Dependency-free parsing of freedesktop ``recently-used.xbel`` files.
+
+Kept free of framework imports because ``parse_xbel`` runs in a worker process
+that re-imports this module.
+"""
+from __future__ import annotations
+
+from typing import Iterator, List, Mapping, Optional, Tuple
+
+try:  # pragma: no cover - optional accelerator
+    from lxml import etree as ET
+
+    _HAS_LXML = True
+except ImportError:  # pragma: no cover - stdlib fallback
+    import xml.etree.ElementTree as ET
+
+    _HAS_LXML = False
+
+XBEL_NAMESPACE = "{http://www.freedesktop.org/standards/desktop-bookmarks}"
+_BOOKMARK_TAG = f"{XBEL_NAMESPACE}bookmark"
+_HTTP_SCHEMES = ("http://", "https://")
+
+BookmarkRow = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def parse_xbel(path: str) -> List[BookmarkRow]:
+    """Extracts ``(href, added, modified, visited)`` for every HTTP(S) bookmark.
+
+    Returns plain tuples so the result can cross a process boundary cheaply.
+    """
+    rows: List[BookmarkRow] = []
+    for attrib in _iter_bookmarks(path):
+        href = attrib.get("href", "")
+        if not href.startswith(_HTTP_SCHEMES):
+            continue
+        rows.append((href, attrib.get("added"), attrib.get("modified"), attrib.get("visited")))
+    return rows
+
+
+def _iter_bookmarks(path: str) -> Iterator[Mapping[str, str]]:
+    """Streams the attributes of every XBEL bookmark, discarding parsed elements as it goes.
+
+    Attributes are only valid until the next item is requested.
+    """
+    if _HAS_LXML:
+        for _, bookmark in ET.iterparse(path, events=("end",), tag=_BOOKMARK_TAG):
+            yield bookmark.attrib
+            bookmark.clear()
+            while bookmark.getprevious() is not None:
+                del bookmark.getparent()[0]
+        return
+    for _, bookmark in ET.iterparse(path, events=("end",)):
+        if bookmark.tag == _BOOKMARK_TAG:
+            yield bookmark.attrib
+            bookmark.clear()
+
+
+__all__ = ["XBEL_NAMESPACE", "BookmarkRow", "parse_xbel"]
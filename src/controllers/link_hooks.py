@@ -27,16 +27,7 @@ class OnLinkOpen(ControllerDecoratorHook):
         self._logger = inject("ASC_LOGGER")
         monitor.ensure_running()
 
-        async def handler(event: LinkClickEvent) -> None:
-            analysis = await firewall.inspect(event)
-            if not analysis.is_rickroll and not self.include_safe:
-                return
-            try:
-                await _maybe_await(_invoke_controller_callback(callable, event, analysis))
-            except Exception:  # pragma: no cover - defensive
-                if self._logger:
-                    self._logger.exception("Link hook handler failed for %s", callable)
-
+        handler = _specialize_handler(callable, firewall, self.include_safe, self._logger)
         self._subscription = monitor.subscribe(
             handler,
             include_safe=self.include_safe,
@@ -44,32 +35,101 @@ class OnLinkOpen(ControllerDecoratorHook):
         )
 
 
-async def _maybe_await(result: Awaitable[Any] | Any) -> None:
-    if inspect.isawaitable(result):
-        await result  # pragma: no cover - trivial awaitable path
-
-
-def _invoke_controller_callback(
+def _specialize_handler(
     callback: Callable[..., Awaitable[Any] | Any],
-    event: LinkClickEvent,
-    analysis: LinkAnalysisResult,
-) -> Awaitable[Any] | Any:
-    signature = inspect.signature(callback)
-    kwargs = {}
-    positional = []
-
-    for parameter in signature.parameters.values():
+    firewall: RickrollFirewallService,
+    include_safe: bool,
+    logger: Optional[Logger],
+) -> Callable[[LinkClickEvent], Awaitable[None]]:
+    """Builds a monitor handler tailored to ``callback``'s signature and sync/async flavour.
+
+    All decisions are taken once at hook load time so the per-event path only
+    inspects the link and calls the controller method. Callables that are not
+    coroutine functions (sync wrappers around async methods, objects with an
+    async ``__call__``) still have any awaitable result awaited.
+    """
+    target = callback
+    is_coro = inspect.iscoroutinefunction(callback)
+    wants_event, wants_analysis = _resolve_calling_convention(callback)
+    use_kwargs = wants_event or wants_analysis
+    if use_kwargs and not (wants_event and wants_analysis):
+        callback = _keyword_adapter(callback, wants_event)
+    skip_safe = not include_safe
+
+    def _report_failure() -> None:  # pragma: no cover - defensive
+        if logger:
+            logger.exception("Link hook handler failed for %s", target)
+
+    async def handler_coro_kwargs(event: LinkClickEvent) -> None:
+        analysis = await firewall.inspect(event)
+        if skip_safe and not analysis.is_rickroll:
+            return
+        try:
+            await callback(event=event, analysis=analysis)
+        except Exception:  # pragma: no cover - defensive
+            _report_failure()
+
+    async def handler_coro_posn(event: LinkClickEvent) -> None:
+        analysis = await firewall.inspect(event)
+        if skip_safe and not analysis.is_rickroll:
+            return
+        try:
+            await callback(event, analysis)
+        except Exception:  # pragma: no cover - defensive
+            _report_failure()
+
+    async def handler_sync_kwargs(event: LinkClickEvent) -> None:
+        analysis = await firewall.inspect(event)
+        if skip_safe and not analysis.is_rickroll:
+            return
+        try:
+            result = callback(event=event, analysis=analysis)
+            if result is not None and inspect.isawaitable(result):
+                await result
+        except Exception:  # pragma: no cover - defensive
+            _report_failure()
+
+    async def handler_sync_posn(event: LinkClickEvent) -> None:
+        analysis = await firewall.inspect(event)
+        if skip_safe and not analysis.is_rickroll:
+            return
+        try:
+            result = callback(event, analysis)
+            if result is not None and inspect.isawaitable(result):
+                await result
+        except Exception:  # pragma: no cover - defensive
+            _report_failure()
+
+    if is_coro:
+        return handler_coro_kwargs if use_kwargs else handler_coro_posn
+    return handler_sync_kwargs if use_kwargs else handler_sync_posn
+
+
+def _keyword_adapter(
+    callback: Callable[..., Awaitable[Any] | Any],
+    wants_event: bool,
+) -> Callable[..., Awaitable[Any] | Any]:
+    """Wraps a callback that accepts only one of ``event``/``analysis`` by keyword."""
+    if wants_event:
+        def adapter(*, event: LinkClickEvent, analysis: LinkAnalysisResult) -> Awaitable[Any] | Any:
+            return callback(event=event)
+    else:
+        def adapter(*, event: LinkClickEvent, analysis: LinkAnalysisResult) -> Awaitable[Any] | Any:
+            return callback(analysis=analysis)
+    return adapter
+
+
+def _resolve_calling_convention(callback: Callable[..., Awaitable[Any] | Any]) -> tuple[bool, bool]:
+    """Returns ``(wants_event, wants_analysis)`` keyword flags for ``callback``."""
+    wants_event = wants_analysis = False
+    for parameter in inspect.signature(callback).parameters.values():
         if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
             continue
         if parameter.name == "event":
-            kwargs["event"] = event
+            wants_event = True
         elif parameter.name == "analysis":
-            kwargs["analysis"] = analysis
-
-    if not kwargs:
-        positional = [event, analysis]
-
-    return callback(*positional, **kwargs)
+            wants_analysis = True
+    return wants_event, wants_analysis
 
 
 __all__ = ["OnLinkOpen"]
@@ -3,16 +3,28 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from collections import deque
+import multiprocessing
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
+from types import CoroutineType
 from logging import Logger
-from typing import Annotated, Awaitable, Callable, Dict, Iterable, List, Optional, Protocol
+from typing import Annotated, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
 
 from ascender.common import Injectable
 from ascender.core import Inject, Service
 
 from common.link_models import LinkClickEvent
+from common.xbel import XBEL_NAMESPACE, BookmarkRow, parse_xbel
+
+try:  # pragma: no cover - Linux-only optional dependency
+    from asyncinotify import Inotify, Mask
+except ImportError:  # pragma: no cover - fall back to polling
+    Inotify = Mask = None
 
 
 class LinkEventSource(Protocol):
@@ -24,6 +36,7 @@ class LinkEventSource(Protocol):
 
 @dataclass(slots=True)
 class _SubscriptionRecord:
+    token: str
     handler: Callable[[LinkClickEvent], Awaitable[None] | None]
     include_safe: bool
     include_blocked: bool
@@ -37,7 +50,9 @@ def _get_loop() -> asyncio.AbstractEventLoop:
 
 
 async def _maybe_await(result: Awaitable[None] | None) -> None:
-    if inspect.isawaitable(result):
+    if result is None:
+        return
+    if result.__class__ is CoroutineType or inspect.isawaitable(result):
         await result  # pragma: no cover - trivial awaitable path
 
 
@@ -51,7 +66,11 @@ class LinkMonitorService(Service):
         logger: Annotated[Logger, Inject("ASC_LOGGER")],
     ) -> None:
         self._handlers: Dict[str, _SubscriptionRecord] = {}
-        self._queue: asyncio.Queue[LinkClickEvent] = asyncio.Queue()
+        self._handlers_gen: int = 0
+        self._handlers_snapshot: Tuple[_SubscriptionRecord, ...] = ()
+        self._snapshot_gen: int = 0
+        self._buffer: List[LinkClickEvent] = []
+        self._has_events = asyncio.Event()
         self._sources: List[LinkEventSource] = []
         self._sources_started: bool = False
         self._dispatch_task: Optional[asyncio.Task[None]] = None
@@ -72,15 +91,18 @@ class LinkMonitorService(Service):
         include_blocked: bool = True,
     ) -> str:
         token = f"sub-{id(handler):x}-{len(self._handlers)}"
-        self._handlers[token] = _SubscriptionRecord(handler, include_safe, include_blocked)
+        self._handlers[token] = _SubscriptionRecord(token, handler, include_safe, include_blocked)
+        self._handlers_gen += 1
         self.ensure_running()
         return token
 
     def unsubscribe(self, token: str) -> None:
-        self._handlers.pop(token, None)
+        if self._handlers.pop(token, None) is not None:
+            self._handlers_gen += 1
 
-    async def publish(self, event: LinkClickEvent) -> None:
-        await self._queue.put(event)
+    def publish(self, event: LinkClickEvent) -> None:
+        self._buffer.append(event)
+        self._has_events.set()
 
     def ensure_running(self) -> None:
         loop = _get_loop()
@@ -93,40 +115,54 @@ class LinkMonitorService(Service):
 
     async def _dispatch_loop(self) -> None:
         while True:
-            event = await self._queue.get()
-            for token, record in list(self._handlers.items()):
-                if event.blocked and not record.include_blocked:
-                    continue
-                if not event.blocked and not record.include_safe:
-                    continue
-                try:
-                    await _maybe_await(record.handler(event))
-                except Exception:  # pragma: no cover - defensive
-                    self._logger.exception("Unhandled exception in link handler %s", token)
+            await self._has_events.wait()
+            self._has_events.clear()
+            batch, self._buffer = self._buffer, []
+            if self._snapshot_gen != self._handlers_gen:
+                self._handlers_snapshot = tuple(self._handlers.values())
+                self._snapshot_gen = self._handlers_gen
+            records = self._handlers_snapshot
+            for event in batch:
+                for record in records:
+                    if event.blocked and not record.include_blocked:
+                        continue
+                    if not event.blocked and not record.include_safe:
+                        continue
+                    try:
+                        await _maybe_await(record.handler(event))
+                    except Exception:  # pragma: no cover - defensive
+                        self._logger.exception("Unhandled exception in link handler %s", record.token)
 
     async def drain(self) -> None:
-        while not self._queue.empty():
+        while self._buffer:
             await asyncio.sleep(0)
 
 
 @Injectable(provided_in="root")
 class DesktopRecentLinkWatcher(Service):
-    """Polls the freedesktop recent files list and emits newly opened HTTP(S) links."""
+    """Watches the freedesktop recent files list and emits newly opened HTTP(S) links.
+
+    Uses inotify on Linux when ``asyncinotify`` is installed and polls every
+    ``poll_interval`` seconds otherwise.
+    """
 
-    _NAMESPACE = "{http://www.freedesktop.org/standards/desktop-bookmarks}"
+    _NAMESPACE = XBEL_NAMESPACE
 
     def __init__(
         self,
         *,
         poll_interval: float = 1.0,
         recent_file: Optional[Path] = None,
+        process_parse_threshold: int = 1 << 20,
         logger: Annotated[Logger, Inject("ASC_LOGGER")],
     ) -> None:
         self.poll_interval = poll_interval
+        self.process_parse_threshold = process_parse_threshold
         self.recent_file = recent_file or Path.home() / ".local/share/recently-used.xbel"
-        self._processed: deque[str] = deque()
-        self._processed_index: set[str] = set()
+        self._processed: OrderedDict[str, None] = OrderedDict()
         self._window: int = 1024
+        self._last_signature: Optional[tuple[int, int]] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         self._task: Optional[asyncio.Task[None]] = None
         self._monitor: Optional[LinkMonitorService] = None
         self._logger = logger
@@ -138,51 +174,109 @@ class DesktopRecentLinkWatcher(Service):
         self._task = loop.create_task(self._watch_loop(), name="recent-link-watcher")
 
     async def _watch_loop(self) -> None:
+        try:
+            if Inotify is not None and sys.platform.startswith("linux"):
+                try:
+                    await self._watch_inotify()
+                except OSError:
+                    self._logger.warning("inotify unavailable for %s, falling back to polling", self.recent_file)
+            await self._poll_loop()
+        finally:
+            self._discard_parse_pool()
+
+    async def _poll_loop(self) -> None:
         while True:
             try:
-                entries = await asyncio.to_thread(self._read_recent_entries)
-                for event in entries:
-                    if self._monitor:
-                        await self._monitor.publish(event)
+                await self._publish_recent_entries()
             except FileNotFoundError:
-                await asyncio.sleep(self.poll_interval)
+                # Removed between stat and parse; the next stat sees it missing.
+                continue
             except asyncio.CancelledError:  # pragma: no cover - task shutdown
                 raise
             except Exception:  # pragma: no cover - defensive
                 self._logger.exception("Failed to read recent link entries")
             await asyncio.sleep(self.poll_interval)
 
-    def _read_recent_entries(self) -> Iterable[LinkClickEvent]:
-        import xml.etree.ElementTree as ET
-
-        if not self.recent_file.exists():
-            raise FileNotFoundError(self.recent_file)
-
-        tree = ET.parse(self.recent_file)
-        root = tree.getroot()
-        namespace = {"bookmark": self._NAMESPACE.strip("{}")}
-        for bookmark in root.findall("bookmark:bookmark", namespaces=namespace):
-            href = bookmark.attrib.get("href", "")
-            if not href.startswith("http"):
-                continue
-            visited = bookmark.attrib.get("visited") or bookmark.attrib.get("added") or ""
+    async def _watch_inotify(self) -> None:
+        """Re-reads the recent file only when the desktop rewrites or replaces it."""
+        with Inotify() as inotify:
+            inotify.add_watch(self.recent_file.parent, Mask.CLOSE_WRITE | Mask.MOVED_TO)
+            await self._refresh_recent_entries()
+            async for change in inotify:
+                if change.name is not None and change.name.name == self.recent_file.name:
+                    await self._refresh_recent_entries()
+
+    async def _refresh_recent_entries(self) -> None:
+        try:
+            await self._publish_recent_entries()
+        except asyncio.CancelledError:  # pragma: no cover - task shutdown
+            raise
+        except Exception:  # pragma: no cover - defensive
+            self._logger.exception("Failed to read recent link entries")
+
+    async def _publish_recent_entries(self) -> None:
+        stat = self._changed_stat()
+        if stat is None:
+            return
+        path = str(self.recent_file)
+        if stat.st_size > self.process_parse_threshold:
+            try:
+                rows = await _get_loop().run_in_executor(self._get_parse_pool(), parse_xbel, path)
+            except BrokenProcessPool:
+                # The worker died (e.g. OOM-killed); rebuild the pool on the next large change.
+                self._logger.warning("XBEL parse worker died, parsing %s in a thread instead", path)
+                self._discard_parse_pool()
+                rows = await asyncio.to_thread(parse_xbel, path)
+        else:
+            rows = await asyncio.to_thread(parse_xbel, path)
+        self._last_signature = (stat.st_mtime_ns, stat.st_size)
+        for event in self._new_events(rows):
+            if self._monitor:
+                self._monitor.publish(event)
+
+    def _changed_stat(self) -> Optional[os.stat_result]:
+        """Returns the recent file's stat result, or ``None`` if it is missing or unchanged."""
+        try:
+            stat = os.stat(self.recent_file)
+        except FileNotFoundError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) == self._last_signature:
+            return None
+        return stat
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        if self._parse_pool is None:
+            # The event loop process already runs worker threads, so avoid fork().
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._parse_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context(method))
+        return self._parse_pool
+
+    def _discard_parse_pool(self) -> None:
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+    def _new_events(self, rows: List[BookmarkRow]) -> List[LinkClickEvent]:
+        events: List[LinkClickEvent] = []
+        source = str(self.recent_file)
+        for href, added, modified, visited in rows:
+            visited = visited or added or ""
             entry_id = f"{href}|{visited}"
-            if entry_id in self._processed_index:
+            if entry_id in self._processed:
                 continue
             self._remember_entry(entry_id)
             metadata = {
-                "added": bookmark.attrib.get("added"),
-                "modified": bookmark.attrib.get("modified"),
+                "added": added,
+                "modified": modified,
                 "visited": visited,
             }
-            yield LinkClickEvent(url=href, source=str(self.recent_file), metadata=metadata)
+            events.append(LinkClickEvent(url=href, source=source, metadata=metadata))
+        return events
 
     def _remember_entry(self, entry_id: str) -> None:
-        self._processed.append(entry_id)
-        self._processed_index.add(entry_id)
+        self._processed[entry_id] = None
         while len(self._processed) > self._window:
-            oldest = self._processed.popleft()
-            self._processed_index.discard(oldest)
+            self._processed.popitem(last=False)
 
 
 __all__ = [
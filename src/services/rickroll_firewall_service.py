@@ -1,55 +1,110 @@
 """Rickroll detection and blocking services."""
 from __future__ import annotations
 
-from collections import deque
+import re
 from logging import Logger
-from typing import Annotated, Any, Dict
+from typing import Annotated, Any, Dict, List, Optional
 
 from ascender.common import Injectable
 from ascender.core import Inject, Service
 
-from common.link_models import LinkAnalysisResult, LinkClickEvent
+from common.link_models import LinkAnalysisResult, LinkClickEvent, isoformat_seconds
+
+try:  # pragma: no cover - optional accelerator
+    import ahocorasick
+except ImportError:  # pragma: no cover - fall back to the regex engine
+    ahocorasick = None
+
+_YOUTUBE_ID = "dqw4w9wgxcq"
+_PATTERN_LABELS: Dict[str, str] = {_YOUTUBE_ID: "YouTube Rickroll ID"}
+_HEURISTIC_KEYWORDS: tuple[str, ...] = ("rick", "astley", "never gonna")
+_SAFE_RESULT = LinkAnalysisResult(False, "No Rickroll indicators detected", matched_pattern=None, confidence=0.1)
+
+
+def _pattern_result(pattern: str) -> LinkAnalysisResult:
+    reason = f"Matched known Rickroll pattern: {_PATTERN_LABELS.get(pattern, pattern)}"
+    return LinkAnalysisResult(True, reason, matched_pattern=pattern)
+
+
+_YOUTUBE_ID_RESULT = _pattern_result(_YOUTUBE_ID)
 
 
 @Injectable(provided_in="root")
 class RickrollDetectorService(Service):
     """Small heuristic engine that flags Rick Astley bait links."""
 
+    # Lowercase substrings in priority order. The YouTube video ID covers every
+    # youtu.be/watch/embed variant and is checked before the others.
     _PATTERNS: tuple[str, ...] = (
-        "dQw4w9WgXcQ",
+        _YOUTUBE_ID,
         "rickroll",
         "rick-roll",
         "never-gonna-give-you-up",
         "rick_astley",
-        "youtu.be/dQw4w9WgXcQ",
-        "youtube.com/watch?v=dQw4w9WgXcQ",
-        "youtube.com/embed/dQw4w9WgXcQ",
         "tiktok.com/@rickastley",
     )
 
-    async def analyze(self, url: str) -> LinkAnalysisResult:
+    def __init__(self) -> None:
+        patterns = tuple(p for p in self._PATTERNS if p != _YOUTUBE_ID)
+        self._ac = _build_automaton(patterns)
+        # Zero-width lookahead so overlapping matches are all reported.
+        self._pattern_re = re.compile("(?=(" + "|".join(map(re.escape, patterns)) + "))")
+        self._pattern_priority = {pattern: priority for priority, pattern in enumerate(patterns)}
+        self._keyword_re = re.compile("|".join(map(re.escape, _HEURISTIC_KEYWORDS)))
+
+    def analyze(self, url: str) -> LinkAnalysisResult:
         lower_url = url.lower()
-        for pattern in self._PATTERNS:
-            if pattern.lower() in lower_url:
-                reason = f"Matched known Rickroll pattern: {pattern}"
-                return LinkAnalysisResult(True, reason, matched_pattern=pattern)
-        if any(token in lower_url for token in ("rick", "astley", "never gonna")):
+        if _YOUTUBE_ID in lower_url:
+            return _YOUTUBE_ID_RESULT
+        pattern = self._match_pattern(lower_url)
+        if pattern is not None:
+            return _pattern_result(pattern)
+        if self._keyword_re.search(lower_url):
             reason = "Matched heuristic keywords associated with Rick Astley"
             return LinkAnalysisResult(True, reason, matched_pattern="heuristic-keywords", confidence=0.7)
-        return LinkAnalysisResult(False, "No Rickroll indicators detected", matched_pattern=None, confidence=0.1)
+        return _SAFE_RESULT
+
+    def _match_pattern(self, lower_url: str) -> Optional[str]:
+        """Returns the highest-priority pattern found in ``lower_url`` with a single scan."""
+        if self._ac is not None:
+            best: Optional[tuple[int, str]] = None
+            for _, tag in self._ac.iter(lower_url):
+                if best is None or tag[0] < best[0]:
+                    best = tag
+            return best[1] if best is not None else None
+        found: Optional[str] = None
+        for match in self._pattern_re.finditer(lower_url):
+            pattern = match.group(1)
+            if found is None or self._pattern_priority[pattern] < self._pattern_priority[found]:
+                found = pattern
+        return found
+
+
+def _build_automaton(patterns: tuple[str, ...]) -> Any:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, pattern in enumerate(patterns):
+        automaton.add_word(pattern, (priority, pattern))
+    automaton.make_automaton()
+    return automaton
 
 
 @Injectable(provided_in="root")
 class RickrollFirewallService(Service):
     """Coordinates detection and blocking state for Rickroll attempts."""
 
+    _HISTORY_SIZE = 200
+
     def __init__(
         self,
         detector: RickrollDetectorService,
         logger: Annotated[Logger, Inject("ASC_LOGGER")],
     ) -> None:
         self._detector = detector
-        self._blocked: deque[Dict[str, Any]] = deque(maxlen=200)
+        self._blocked: List[Optional[Dict[str, Any]]] = [None] * self._HISTORY_SIZE
+        self._blocked_idx = 0
+        self._blocked_count = 0
         self._logger = logger
 
     async def inspect(self, event: LinkClickEvent) -> LinkAnalysisResult:
@@ -57,22 +112,31 @@ class RickrollFirewallService(Service):
         if isinstance(cached, LinkAnalysisResult):
             result = cached
         else:
-            result = await self._detector.analyze(event.url)
+            result = self._detector.analyze(event.url)
             event.metadata["analysis"] = result
         if result.is_rickroll and not event.blocked:
             event.block(reason=result.reason, blocked_by=self.__class__.__name__)
-            self._blocked.append(
-                {
-                    "url": event.url,
-                    "when": event.timestamp.isoformat(timespec="seconds"),
-                    "reason": result.reason,
-                }
-            )
+            self._record_block(event, result)
             self._logger.warning("Blocked Rickroll attempt: %s", event.url)
         return result
 
     def history(self) -> list[Dict[str, Any]]:
-        return list(self._blocked)
+        if self._blocked_count < self._HISTORY_SIZE:
+            ordered = self._blocked[: self._blocked_count]
+        else:
+            ordered = self._blocked[self._blocked_idx :] + self._blocked[: self._blocked_idx]
+        return [dict(slot) for slot in ordered if slot is not None]
+
+    def _record_block(self, event: LinkClickEvent, result: LinkAnalysisResult) -> None:
+        """Writes a block into the history ring, reusing the slot's dict once the ring wraps."""
+        slot = self._blocked[self._blocked_idx]
+        if slot is None:
+            slot = self._blocked[self._blocked_idx] = {}
+        slot["url"] = event.url
+        slot["when"] = isoformat_seconds(event.timestamp_ns)
+        slot["reason"] = result.reason
+        self._blocked_idx = (self._blocked_idx + 1) % self._HISTORY_SIZE
+        self._blocked_count += 1
 
 
 __all__ = [